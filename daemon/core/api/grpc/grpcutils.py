@@ -430,12 +430,17 @@ def convert_core_link(core_link: CoreLink) -> list[core_pb2.Link]:
     links = []
     node1, iface1 = core_link.node1, core_link.iface1
     node2, iface2 = core_link.node2, core_link.iface2
+    # convert interfaces once, as they are shared by both link directions
+    iface1_proto = convert_iface(iface1) if iface1 is not None else None
+    iface2_proto = convert_iface(iface2) if iface2 is not None else None
     unidirectional = core_link.is_unidirectional()
-    link = convert_link(node1, iface1, node2, iface2, iface1.options, unidirectional)
+    link = convert_link(
+        node1, iface1_proto, node2, iface2_proto, iface1.options, unidirectional
+    )
     links.append(link)
     if unidirectional:
         link = convert_link(
-            node2, iface2, node1, iface1, iface2.options, unidirectional
+            node2, iface2_proto, node1, iface1_proto, iface2.options, unidirectional
         )
         links.append(link)
     return links
@@ -525,9 +530,9 @@ def convert_options_proto(options: core_pb2.LinkOptions) -> LinkOptions:
 
 def convert_link(
     node1: NodeBase,
-    iface1: Optional[CoreInterface],
+    iface1: Optional[core_pb2.Interface],
     node2: NodeBase,
-    iface2: Optional[CoreInterface],
+    iface2: Optional[core_pb2.Interface],
     options: LinkOptions,
     unidirectional: bool,
 ) -> core_pb2.Link:
@@ -535,17 +540,13 @@ def convert_link(
     Convert link objects to link protobuf.
 
     :param node1: first node in link
-    :param iface1: node1 interface
+    :param iface1: node1 interface protobuf
     :param node2: second node in link
-    :param iface2: node2 interface
+    :param iface2: node2 interface protobuf
     :param options: link options
     :param unidirectional: if this link is considered unidirectional
     :return: protobuf link
     """
-    if iface1 is not None:
-        iface1 = convert_iface(iface1)
-    if iface2 is not None:
-        iface2 = convert_iface(iface2)
     is_node1_wireless = isinstance(node1, (WlanNode, EmaneNet))
     is_node2_wireless = isinstance(node2, (WlanNode, EmaneNet))
     if not (is_node1_wireless or is_node2_wireless):
@@ -85,17 +85,18 @@ class TunTap(CoreInterface):
             if r == 0:
                 result = True
                 break
-            msg = f"attempt {i} failed with nonzero exit status {r}"
             if i < attempts + 1:
-                msg += ", retrying..."
-                logger.info(msg)
+                logger.info(
+                    "attempt %s failed with nonzero exit status %s, retrying...", i, r
+                )
                 time.sleep(delay)
                 delay += delay
                 if delay > maxretrydelay:
                     delay = maxretrydelay
             else:
-                msg += ", giving up"
-                logger.info(msg)
+                logger.info(
+                    "attempt %s failed with nonzero exit status %s, giving up", i, r
+                )
         return result
 
     def nodedevexists(self) -> int:
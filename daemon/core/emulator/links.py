@@ -8,7 +8,7 @@ from collections.abc import ValuesView
 from dataclasses import dataclass
 from typing import Optional
 
-from core.emulator.data import LinkData, LinkOptions
+from core.emulator.data import InterfaceData, LinkData, LinkOptions
 from core.emulator.enumerations import LinkTypes, MessageFlags
 from core.errors import CoreError
 from core.nodes.base import NodeBase
@@ -91,6 +91,16 @@ class CoreLink:
                 options = self.iface2.options
         return options
 
+    def ifaces_data(self) -> tuple[Optional[InterfaceData], Optional[InterfaceData]]:
+        """
+        Retrieve the data representation of both link interfaces.
+
+        :return: iface1 and iface2 data, None for a missing interface
+        """
+        iface1_data = self.iface1.get_data() if self.iface1 else None
+        iface2_data = self.iface2.get_data() if self.iface2 else None
+        return iface1_data, iface2_data
+
     def get_data(self, message_type: MessageFlags, source: str = None) -> LinkData:
         """
         Create link data for this link.
@@ -99,8 +109,7 @@ class CoreLink:
         :param source: source for this data
         :return: link data
         """
-        iface1_data = self.iface1.get_data() if self.iface1 else None
-        iface2_data = self.iface2.get_data() if self.iface2 else None
+        iface1_data, iface2_data = self.ifaces_data()
         return LinkData(
             message_type=message_type,
             type=LinkTypes.WIRED,
@@ -121,8 +130,7 @@ class CoreLink:
         :param source: source for this data
         :return: unidirectional link data
         """
-        iface1_data = self.iface1.get_data() if self.iface1 else None
-        iface2_data = self.iface2.get_data() if self.iface2 else None
+        iface1_data, iface2_data = self.ifaces_data()
         return LinkData(
             message_type=MessageFlags.NONE,
             type=LinkTypes.WIRED,
@@ -23,7 +23,7 @@ from core.config import (
     ModelManager,
 )
 from core.emane.nodes import EmaneNet
-from core.emulator.data import LinkData, LinkOptions
+from core.emulator.data import InterfaceData, LinkData, LinkOptions
 from core.emulator.enumerations import EventTypes, LinkTypes, MessageFlags, RegisterTlvs
 from core.errors import CoreError
 from core.executables import BASH
@@ -196,6 +196,19 @@ class WirelessModel(ConfigurableOptions):
         """
         return []
 
+    def set_positions(self, ifaces: list[CoreInterface]) -> None:
+        """
+        Set the current positions for a group of interfaces, defaults to
+        invoking the position callback for each interface.
+
+        :param ifaces: interfaces to set positions for
+        :return: nothing
+        """
+        if self.position_callback is None:
+            return
+        for iface in ifaces:
+            self.position_callback(iface)
+
     def update(self, moved_ifaces: list[CoreInterface]) -> None:
         """
         Update this wireless model.
@@ -255,6 +268,9 @@ class BasicRangeModel(WirelessModel):
         self.loss: Optional[float] = None
         self.jitter: Optional[int] = None
         self.promiscuous: bool = False
+        # one instance is aliased into every link data created, so handlers must
+        # not mutate it, a new instance is created on config updates
+        self.link_options: LinkOptions = LinkOptions()
 
     def setlinkparams(self) -> None:
         """
@@ -263,13 +279,7 @@ class BasicRangeModel(WirelessModel):
         """
         with self.iface_lock:
             for iface in self.iface_to_pos:
-                options = LinkOptions(
-                    bandwidth=self.bw,
-                    delay=self.delay,
-                    loss=self.loss,
-                    jitter=self.jitter,
-                )
-                iface.update_options(options)
+                iface.update_options(self.link_options)
 
     def get_position(self, iface: CoreInterface) -> tuple[float, float, float]:
         """
@@ -300,6 +310,28 @@ class BasicRangeModel(WirelessModel):
 
     position_callback = set_position
 
+    def set_positions(self, ifaces: list[CoreInterface]) -> None:
+        """
+        Set positions for a group of interfaces together, then calculate links
+        once per interface pair using the updated positions.
+
+        :param ifaces: interfaces to set positions for
+        :return: nothing
+        """
+        with self.iface_lock:
+            for iface in ifaces:
+                self.iface_to_pos[iface] = iface.node.position.get()
+            calculated = set()
+            for iface in ifaces:
+                calculated.add(iface)
+                x, y, _ = self.iface_to_pos[iface]
+                if x is None or y is None:
+                    continue
+                for iface2 in self.iface_to_pos:
+                    if iface2 in calculated:
+                        continue
+                    self.calclink(iface, iface2)
+
     def update(self, moved_ifaces: list[CoreInterface]) -> None:
         """
         Node positions have changed without recalc. Update positions from
@@ -397,10 +429,17 @@ class BasicRangeModel(WirelessModel):
         elif not self.promiscuous and promiscuous:
             self.wlan.net_client.set_mac_learning(self.wlan.brname, LEARNING_DISABLED)
         self.promiscuous = promiscuous
+        self.link_options = LinkOptions(
+            bandwidth=self.bw, delay=self.delay, loss=self.loss, jitter=self.jitter
+        )
         self.setlinkparams()
 
     def create_link_data(
-        self, iface1: CoreInterface, iface2: CoreInterface, message_type: MessageFlags
+        self,
+        iface1: CoreInterface,
+        iface2: CoreInterface,
+        message_type: MessageFlags,
+        ifaces_data: dict[CoreInterface, InterfaceData] = None,
     ) -> LinkData:
         """
         Create a wireless link/unlink data message.
@@ -408,23 +447,28 @@ class BasicRangeModel(WirelessModel):
         :param iface1: interface one
         :param iface2: interface two
         :param message_type: link message type
+        :param ifaces_data: interface data cache, to reuse interface data across
+            link data created together
         :return: link data
         """
+        if ifaces_data is None:
+            ifaces_data = {}
+        iface1_data = ifaces_data.get(iface1)
+        if iface1_data is None:
+            iface1_data = ifaces_data[iface1] = iface1.get_data()
+        iface2_data = ifaces_data.get(iface2)
+        if iface2_data is None:
+            iface2_data = ifaces_data[iface2] = iface2.get_data()
         color = self.session.get_link_color(self.wlan.id)
         return LinkData(
             message_type=message_type,
             type=LinkTypes.WIRELESS,
             node1_id=iface1.node.id,
-            iface1=iface1.get_data(),
+            iface1=iface1_data,
             node2_id=iface2.node.id,
-            iface2=iface2.get_data(),
+            iface2=iface2_data,
             network_id=self.wlan.id,
-            options=LinkOptions(
-                bandwidth=self.bw,
-                delay=self.delay,
-                loss=self.loss,
-                jitter=self.jitter,
-            ),
+            options=self.link_options,
             color=color,
         )
 
@@ -451,11 +495,13 @@ class BasicRangeModel(WirelessModel):
         :return: all link data
         """
         all_links = []
+        ifaces_data = {}
         with self.wlan.linked_lock:
             for a in self.wlan.linked:
                 for b in self.wlan.linked[a]:
                     if self.wlan.linked[a][b]:
-                        all_links.append(self.create_link_data(a, b, flags))
+                        link_data = self.create_link_data(a, b, flags, ifaces_data)
+                        all_links.append(link_data)
         return all_links
 
 
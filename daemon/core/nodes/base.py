@@ -11,8 +11,6 @@ from pathlib import Path
 from threading import RLock
 from typing import TYPE_CHECKING, Optional
 
-import netaddr
-
 from core import utils
 from core.emulator.data import InterfaceData, LinkOptions
 from core.errors import CoreCommandError, CoreError
@@ -928,7 +926,7 @@ class CoreNode(CoreNodeBase):
         for ip in iface.ips():
             # ipv4 check
             broadcast = None
-            if netaddr.valid_ipv4(str(ip.ip)):
+            if ip.version == 4:
                 broadcast = "+"
             self.node_net_client.create_address(iface.name, str(ip), broadcast)
         # configure iface options
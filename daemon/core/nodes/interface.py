@@ -193,8 +193,7 @@ class CoreInterface:
         """
         try:
             ip = netaddr.IPNetwork(ip)
-            address = str(ip.ip)
-            if netaddr.valid_ipv4(address):
+            if ip.version == 4:
                 self.ip4s.append(ip)
             else:
                 self.ip6s.append(ip)
@@ -211,8 +210,7 @@ class CoreInterface:
         """
         try:
             ip = netaddr.IPNetwork(ip)
-            address = str(ip.ip)
-            if netaddr.valid_ipv4(address):
+            if ip.version == 4:
                 self.ip4s.remove(ip)
             else:
                 self.ip6s.remove(ip)
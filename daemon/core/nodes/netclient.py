@@ -1,12 +1,12 @@
 """
 Clients for dealing with bridge/interface commands.
 """
-from typing import Callable
+from typing import Callable, Optional
 
 import netaddr
 
 from core import utils
-from core.executables import ETHTOOL, IP, OVS_VSCTL, SYSCTL, TC
+from core.executables import BASH, ETHTOOL, IP, OVS_VSCTL, SYSCTL, TC
 
 
 class LinuxNetClient:
@@ -22,6 +22,23 @@ class LinuxNetClient:
         """
         self.run: Callable[..., str] = run
 
+    def batch(self, cmds: list[str]) -> None:
+        """
+        Run a series of ip commands, stopping at the first command to fail.
+        Longer series are piped through bash into a single ip batch process,
+        shorter ones are run as direct ip calls, as the bash and printf
+        processes would cost as much as the calls they replace.
+
+        :param cmds: ip commands to run, without the leading ip executable
+        :return: nothing
+        """
+        if len(cmds) <= 2:
+            for cmd in cmds:
+                self.run(f"{IP} {cmd}")
+            return
+        lines = " ".join(f"'{cmd}'" for cmd in cmds)
+        self.run(f"{BASH} -c \"printf '%s\\n' {lines} | {IP} -batch -\"")
+
     def create_route(self, route: str, device: str) -> None:
         """
         Create a new route for a device.
@@ -158,10 +175,43 @@ class LinuxNetClient:
         else:
             self.run(f"{IP} address add {address} dev {device}")
         if netaddr.valid_ipv6(address.split("/")[0]):
-            # IPv6 addresses are removed by default on interface down.
-            # Make sure that the IPv6 address we add is not removed
-            device = utils.sysctl_devname(device)
-            self.run(f"{SYSCTL} -w net.ipv6.conf.{device}.keep_addr_on_down=1")
+            self.keep_addrs_on_down(device)
+
+    def keep_addrs_on_down(self, device: str) -> None:
+        """
+        Keep IPv6 addresses on a device when it is brought down, as they are
+        removed by default.
+
+        :param device: device to keep addresses on
+        :return: nothing
+        """
+        device = utils.sysctl_devname(device)
+        self.run(f"{SYSCTL} -w net.ipv6.conf.{device}.keep_addr_on_down=1")
+
+    def create_addresses(
+        self, device: str, addresses: list[tuple[str, Optional[str]]], up: bool
+    ) -> None:
+        """
+        Create addresses for a device and optionally bring it up, within a
+        single ip process.
+
+        :param device: device to add addresses to
+        :param addresses: addresses to add, paired with a broadcast address or None
+        :param up: True to bring the device up after adding addresses
+        :return: nothing
+        """
+        cmds = []
+        for address, broadcast in addresses:
+            if broadcast is not None:
+                cmds.append(f"address add {address} broadcast {broadcast} dev {device}")
+            else:
+                cmds.append(f"address add {address} dev {device}")
+        if any(netaddr.valid_ipv6(x[0].split("/")[0]) for x in addresses):
+            self.keep_addrs_on_down(device)
+        if up:
+            cmds.append(f"link set {device} up")
+        if cmds:
+            self.batch(cmds)
 
     def delete_address(self, device: str, address: str) -> None:
         """
@@ -212,12 +262,16 @@ class LinuxNetClient:
         :param name: bridge name
         :return: nothing
         """
-        self.run(f"{IP} link add name {name} type bridge")
-        self.run(f"{IP} link set {name} type bridge stp_state 0")
-        self.run(f"{IP} link set {name} type bridge forward_delay 0")
-        self.run(f"{IP} link set {name} type bridge mcast_snooping 0")
-        self.run(f"{IP} link set {name} type bridge group_fwd_mask 65528")
-        self.device_up(name)
+        self.batch(
+            [
+                f"link add name {name} type bridge",
+                f"link set {name} type bridge stp_state 0",
+                f"link set {name} type bridge forward_delay 0",
+                f"link set {name} type bridge mcast_snooping 0",
+                f"link set {name} type bridge group_fwd_mask 65528",
+                f"link set {name} up",
+            ]
+        )
 
     def delete_bridge(self, name: str) -> None:
         """
@@ -258,13 +312,11 @@ class LinuxNetClient:
         :return: True if there are existing bridges, False otherwise
         """
         output = self.run(f"{IP} -o link show type bridge")
-        lines = output.split("\n")
-        for line in lines:
-            values = line.split(":")
-            if not len(values) >= 2:
+        for line in output.splitlines():
+            values = line.split(":", 2)
+            if len(values) < 2:
                 continue
-            name = values[1]
-            fields = name.split(".")
+            fields = values[1].split(".")
             if len(fields) != 3:
                 continue
             if fields[0] == "b" and fields[1] == _id:
@@ -304,10 +356,12 @@ class OvsNetClient(LinuxNetClient):
         :param name: bridge name
         :return: nothing
         """
-        self.run(f"{OVS_VSCTL} add-br {name}")
-        self.run(f"{OVS_VSCTL} set bridge {name} stp_enable=false")
-        self.run(f"{OVS_VSCTL} set bridge {name} other_config:stp-max-age=6")
-        self.run(f"{OVS_VSCTL} set bridge {name} other_config:stp-forward-delay=4")
+        self.run(
+            f"{OVS_VSCTL} add-br {name} "
+            f"-- set bridge {name} stp_enable=false "
+            f"-- set bridge {name} other_config:stp-max-age=6 "
+            f"-- set bridge {name} other_config:stp-forward-delay=4"
+        )
         self.device_up(name)
 
     def delete_bridge(self, name: str) -> None:
@@ -349,11 +403,10 @@ class OvsNetClient(LinuxNetClient):
         :return: True if there are existing bridges, False otherwise
         """
         output = self.run(f"{OVS_VSCTL} list-br")
-        if output:
-            for line in output.split("\n"):
-                fields = line.split(".")
-                if fields[0] == "b" and fields[1] == _id:
-                    return True
+        for line in output.splitlines():
+            fields = line.split(".")
+            if fields[0] == "b" and fields[1] == _id:
+                return True
         return False
 
     def set_mac_learning(self, name: str, value: int) -> None:
@@ -287,7 +287,7 @@ class CoreNetwork(CoreNetworkBase):
             if self.has_nftables_chain:
                 nft_queue.delete_table(self)
         except CoreCommandError:
-            logging.exception("error during shutdown")
+            logger.exception("error during shutdown")
         # removes veth pairs used for bridge-to-bridge connections
         for iface in self.get_ifaces():
             iface.shutdown()
@@ -743,9 +743,10 @@ class WlanNode(CoreNetwork):
         logger.debug("node(%s) setting model: %s", self.name, wireless_model.name)
         if wireless_model.config_type == RegisterTlvs.WIRELESS:
             self.wireless_model = wireless_model(session=self.session, _id=self.id)
-            for iface in self.get_ifaces():
+            ifaces = self.get_ifaces()
+            for iface in ifaces:
                 iface.poshook = self.wireless_model.position_callback
-                iface.setposition()
+            self.wireless_model.set_positions([x for x in ifaces if x.node])
             self.updatemodel(config)
         elif wireless_model.config_type == RegisterTlvs.MOBILITY:
             self.mobility = wireless_model(session=self.session, _id=self.id)
@@ -763,8 +764,8 @@ class WlanNode(CoreNetwork):
             "node(%s) updating model(%s): %s", self.id, self.wireless_model.name, config
         )
         self.wireless_model.update_config(config)
-        for iface in self.get_ifaces():
-            iface.setposition()
+        ifaces = [x for x in self.get_ifaces() if x.node]
+        self.wireless_model.set_positions(ifaces)
 
     def links(self, flags: MessageFlags = MessageFlags.NONE) -> list[LinkData]:
         """
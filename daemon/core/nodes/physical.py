@@ -3,6 +3,7 @@ PhysicalNode class for including real systems in the emulated network.
 """
 
 import logging
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
@@ -47,6 +48,8 @@ class Rj45Node(CoreNodeBase):
         :param options: option to create node with
         """
         super().__init__(session, _id, name, server, options)
+        # interface creation is the only user and never re-enters the lock
+        self.lock: threading.Lock = threading.Lock()
         self.iface: CoreInterface = CoreInterface(
             self.iface_id, name, name, session.use_ovs(), node=self, server=server
         )
@@ -162,11 +165,12 @@ class Rj45Node(CoreNodeBase):
         self.old_addrs: list[tuple[str, Optional[str]]] = []
         localname = self.iface.localname
         output = self.net_client.address_show(localname)
-        for line in output.split("\n"):
+        link_name = f"{localname}:"
+        for line in output.splitlines():
             items = line.split()
             if len(items) < 2:
                 continue
-            if items[1] == f"{localname}:":
+            if items[1] == link_name:
                 flags = items[2][1:-1].split(",")
                 if "UP" in flags:
                     self.old_up = True
@@ -175,9 +179,7 @@ class Rj45Node(CoreNodeBase):
                 if items[2] == "brd":
                     broadcast = items[3]
                 self.old_addrs.append((items[1], broadcast))
-            elif items[0] == "inet6":
-                if items[1][:4] == "fe80":
-                    continue
+            elif items[0] == "inet6" and not items[1].startswith("fe80"):
                 self.old_addrs.append((items[1], None))
         logger.info("saved rj45 state: addrs(%s) up(%s)", self.old_addrs, self.old_up)
 
@@ -190,10 +192,7 @@ class Rj45Node(CoreNodeBase):
         """
         localname = self.iface.localname
         logger.info("restoring rj45 state: %s", localname)
-        for addr in self.old_addrs:
-            self.net_client.create_address(localname, addr[0], addr[1])
-        if self.old_up:
-            self.net_client.device_up(localname)
+        self.net_client.create_addresses(localname, self.old_addrs, self.old_up)
 
     def setposition(self, x: float = None, y: float = None, z: float = None) -> None:
         """
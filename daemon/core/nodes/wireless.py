@@ -139,7 +139,7 @@ class WirelessNode(CoreNetworkBase):
 
     def attach(self, iface: CoreInterface) -> None:
         super().attach(iface)
-        logging.info("attaching node(%s) iface(%s)", iface.node.name, iface.name)
+        logger.info("attaching node(%s) iface(%s)", iface.node.name, iface.name)
         if self.up:
             # create node unique bridge
             bridge_name = f"wb{iface.node.id}.{self.id}.{self.session.id}"
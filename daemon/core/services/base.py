@@ -149,8 +149,10 @@ class CoreService(abc.ABC):
                 self.node.cmd(cmd, shell=True)
             except CoreCommandError:
                 logger.exception(
-                    f"node({self.node.name}) service({self.name}) "
-                    f"failed shutdown: {cmd}"
+                    "node(%s) service(%s) failed shutdown: %s",
+                    self.node.name,
+                    self.name,
+                    cmd,
                 )
 
     def restart(self) -> None:
@@ -378,8 +380,10 @@ class CoreService(abc.ABC):
                 index += 1
             except CoreCommandError:
                 logger.debug(
-                    f"node({self.node.name}) service({self.name}) "
-                    f"validate command failed: {cmd}"
+                    "node(%s) service(%s) validate command failed: %s",
+                    self.node.name,
+                    self.name,
+                    cmd,
                 )
                 time.sleep(self.validation_period)
 
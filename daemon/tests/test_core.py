@@ -12,7 +12,7 @@ from core.emulator.data import IpPrefixes, NodeData
 from core.emulator.session import Session
 from core.errors import CoreCommandError
 from core.location.mobility import BasicRangeModel, Ns2ScriptedMobility
-from core.nodes.base import CoreNode, NodeBase
+from core.nodes.base import CoreNode, NodeBase, Position
 from core.nodes.network import HubNode, SwitchNode, WlanNode
 
 _PATH: Path = Path(__file__).resolve().parent
@@ -92,6 +92,50 @@ class TestCore:
         status = ping(node1, node2, ip_prefixes)
         assert not status
 
+    def test_wlan_basic_range_links(self, session: Session, ip_prefixes: IpPrefixes):
+        """
+        Test basic range links are calculated when setting and updating the model.
+
+        :param session: session for test
+        :param ip_prefixes: generates ip addresses for nodes
+        """
+
+        def linked_pairs() -> set[frozenset[int]]:
+            pairs = set()
+            for iface1, ifaces in wlan_node.linked.items():
+                for iface2, linked in ifaces.items():
+                    if linked:
+                        pairs.add(frozenset((iface1.node.id, iface2.node.id)))
+            return pairs
+
+        # given
+        wlan_node = session.add_node(WlanNode)
+        options = CoreNode.create_options()
+        options.model = "mdr"
+        nodes = []
+        for x in (0, 100, 300):
+            position = Position(x=x, y=0)
+            node = session.add_node(CoreNode, position=position, options=options)
+            iface_data = ip_prefixes.create_iface(node)
+            session.add_link(node.id, wlan_node.id, iface1_data=iface_data)
+            nodes.append(node)
+        node1, node2, node3 = nodes
+
+        # when
+        session.mobility.set_model(wlan_node, BasicRangeModel, {"range": "150"})
+
+        # then
+        assert linked_pairs() == {frozenset((node1.id, node2.id))}
+
+        # when
+        wlan_node.updatemodel({"range": "250"})
+
+        # then
+        assert linked_pairs() == {
+            frozenset((node1.id, node2.id)),
+            frozenset((node2.id, node3.id)),
+        }
+
     def test_mobility(self, session: Session, ip_prefixes: IpPrefixes):
         """
         Test basic wlan network.
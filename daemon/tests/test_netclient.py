@@ -0,0 +1,78 @@
+from unittest import mock
+
+from core.nodes.netclient import LinuxNetClient
+
+
+class TestNetClient:
+    def test_batch(self):
+        # given
+        run = mock.Mock()
+        net_client = LinuxNetClient(run)
+
+        # when
+        net_client.batch(
+            ["link set eth0 down", "address flush dev eth0", "link set eth0 up"]
+        )
+
+        # then
+        run.assert_called_once_with(
+            "bash -c \"printf '%s\\n' 'link set eth0 down' "
+            "'address flush dev eth0' 'link set eth0 up' | ip -batch -\""
+        )
+
+    def test_batch_two(self):
+        # given
+        run = mock.Mock()
+        net_client = LinuxNetClient(run)
+
+        # when
+        net_client.batch(["address add 10.0.0.1/24 dev eth0", "link set eth0 up"])
+
+        # then
+        assert run.call_args_list == [
+            mock.call("ip address add 10.0.0.1/24 dev eth0"),
+            mock.call("ip link set eth0 up"),
+        ]
+
+    def test_batch_single(self):
+        # given
+        run = mock.Mock()
+        net_client = LinuxNetClient(run)
+
+        # when
+        net_client.batch(["link set eth0 up"])
+
+        # then
+        run.assert_called_once_with("ip link set eth0 up")
+
+    def test_create_addresses(self):
+        # given
+        run = mock.Mock()
+        net_client = LinuxNetClient(run)
+        addresses = [("10.0.0.1/24", "10.0.0.255"), ("2001::1/64", None)]
+
+        # when
+        net_client.create_addresses("eth0", addresses, True)
+
+        # then
+        assert run.call_count == 2
+        run.assert_any_call("sysctl -w net.ipv6.conf.eth0.keep_addr_on_down=1")
+        run.assert_any_call(
+            "bash -c \"printf '%s\\n' "
+            "'address add 10.0.0.1/24 broadcast 10.0.0.255 dev eth0' "
+            "'address add 2001::1/64 dev eth0' 'link set eth0 up' | ip -batch -\""
+        )
+
+    def test_create_bridge(self):
+        # given
+        run = mock.Mock()
+        net_client = LinuxNetClient(run)
+
+        # when
+        net_client.create_bridge("b.1.1")
+
+        # then
+        run.assert_called_once()
+        args = run.call_args[0][0]
+        assert "'link add name b.1.1 type bridge'" in args
+        assert args.endswith("'link set b.1.1 up' | ip -batch -\"")
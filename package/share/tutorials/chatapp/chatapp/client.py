@@ -1,16 +1,18 @@
 import argparse
-import select
-import socket
+import asyncio
+import os
 import sys
 import termios
 
 DEFAULT_PORT: int = 9001
 READ_SIZE: int = 4096
+CLEAR_LINE: bytes = b"\x1b[2K\r"
+PROMPT: bytes = b">> "
+NEWLINE: bytes = b"\n"
 
 
 def prompt():
-    sys.stdout.write(">> ")
-    sys.stdout.flush()
+    os.write(sys.stdout.fileno(), PROMPT)
 
 
 class ChatClient:
@@ -19,37 +21,40 @@ class ChatClient:
         self.port = port
 
     def run(self):
-        server = socket.create_connection((self.address, self.port))
-        sockname = server.getsockname()
+        try:
+            asyncio.run(self.chat())
+        except KeyboardInterrupt:
+            print("client exiting")
+
+    async def chat(self):
+        reader, writer = await asyncio.open_connection(self.address, self.port)
+        sockname = writer.get_extra_info("sockname")
         print(
             f"connected to server({self.address}:{self.port}) as "
-            f"client({sockname[0]}:{sockname[1]})"
+            f"client({sockname[0]}:{sockname[1]})",
+            flush=True,
         )
-        sockets = [sys.stdin, server]
+        loop = asyncio.get_running_loop()
+        loop.add_reader(sys.stdin.fileno(), self.send_input, writer)
         prompt()
         try:
             while True:
-                read_sockets, write_socket, error_socket = select.select(
-                    sockets, [], []
-                )
-                for sock in read_sockets:
-                    if sock == server:
-                        message = server.recv(READ_SIZE)
-                        if not message:
-                            print("server closed")
-                            sys.exit(1)
-                        else:
-                            termios.tcflush(sys.stdin, termios.TCIOFLUSH)
-                            print("\x1b[2K\r", end="")
-                            print(message.decode().strip())
-                            prompt()
-                    else:
-                        message = sys.stdin.readline().strip()
-                        server.sendall(f"{message}\n".encode())
-                        prompt()
-        except KeyboardInterrupt:
-            print("client exiting")
-            server.close()
+                message = await reader.read(READ_SIZE)
+                if not message:
+                    print("server closed")
+                    sys.exit(1)
+                termios.tcflush(sys.stdin, termios.TCIOFLUSH)
+                # clear input line, show message, and prompt in a single write
+                output = b"".join((CLEAR_LINE, message.strip(), NEWLINE, PROMPT))
+                os.write(sys.stdout.fileno(), output)
+        finally:
+            loop.remove_reader(sys.stdin.fileno())
+            writer.close()
+
+    def send_input(self, writer):
+        message = sys.stdin.buffer.readline().strip()
+        writer.writelines((message, NEWLINE))
+        prompt()
 
 
 def main():
@@ -13,5 +13,5 @@ setup(
     },
     include_package_data=True,
     zip_safe=False,
-    python_requires=">=3.6",
+    python_requires=">=3.7",
 )